@@ -98,6 +98,18 @@ RUNNER_CFG_SCHEMA = {
         },
     },
     Optional("timeout"): And(int, _larger_than_zero),
+    # wire format used by remote runner clients; "pickle" is kept for rollback only
+    Optional("serialization"): Or("msgpack", "pickle"),
+    # connection pool size of remote runner clients, in total and for a single host
+    # (0 for no per host limit: a client only ever connects to its runner server)
+    Optional("connection_limit"): And(int, _larger_than_zero),
+    Optional("per_host_limit"): And(int, _larger_than(-1)),
+    # coalesce concurrent calls of remote runner clients into batch requests
+    Optional("client_batching"): {
+        Optional("enabled"): bool,
+        Optional("max_batch_size"): And(int, _larger_than_zero),
+        Optional("max_latency_ms"): And(int, _larger_than_zero),
+    },
 }
 
 SCHEMA = Schema(
@@ -217,10 +229,28 @@ class BentoMLConfiguration:
 
             global_runner_cfg = {
                 k: self.config["runners"][k]
-                for k in ("batching", "resources", "logging", "timeout")
+                for k in (
+                    "batching",
+                    "resources",
+                    "logging",
+                    "timeout",
+                    "serialization",
+                    "connection_limit",
+                    "per_host_limit",
+                    "client_batching",
+                )
             }
             for key in self.config["runners"]:
-                if key not in ["batching", "resources", "logging", "timeout"]:
+                if key not in [
+                    "batching",
+                    "resources",
+                    "logging",
+                    "timeout",
+                    "serialization",
+                    "connection_limit",
+                    "per_host_limit",
+                    "client_batching",
+                ]:
                     runner_cfg = self.config["runners"][key]
 
                     # key is a runner name
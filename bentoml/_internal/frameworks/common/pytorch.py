@@ -163,7 +163,7 @@ class PyTorchTensorContainer(DataContainer[torch.Tensor, torch.Tensor]):
             import pyarrow.plasma as plasma
 
             assert plasma_db
-            ret = plasma_db.get(plasma.ObjectID(payload.data))
+            ret = plasma_db.get(plasma.ObjectID(bytes(payload.data)))
 
         else:
             ret = pickle.loads(payload.data)
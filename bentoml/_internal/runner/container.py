@@ -20,7 +20,8 @@ if TYPE_CHECKING:
 
 
 class Payload(t.NamedTuple):
-    data: bytes
+    # a bytearray when read by a remote runner client into a preallocated buffer
+    data: bytes | bytearray
     meta: dict[str, bool | int | float | str]
     container: str
     batch_size: int = -1
@@ -129,7 +130,9 @@ class NdarrayContainer(
             )
 
         return cls.create_payload(
-            pickle.dumps(batch),
+            # use the highest protocol, which avoids an intermediate copy of array
+            # buffers where supported
+            pickle.dumps(batch, protocol=pickle.HIGHEST_PROTOCOL),
             batch.shape[batch_dim],
             {"plasma": False},
         )
@@ -145,7 +148,7 @@ class NdarrayContainer(
             import pyarrow.plasma as plasma
 
             assert plasma_db
-            return plasma_db.get(plasma.ObjectID(payload.data))
+            return plasma_db.get(plasma.ObjectID(bytes(payload.data)))
 
         return pickle.loads(payload.data)
 
@@ -304,7 +307,9 @@ class PandasDataFrameContainer(
             )
 
         return cls.create_payload(
-            pickle.dumps(batch),
+            # use the highest protocol, which avoids an intermediate copy of array
+            # buffers where supported
+            pickle.dumps(batch, protocol=pickle.HIGHEST_PROTOCOL),
             batch.size,
             {"plasma": False},
         )
@@ -320,7 +325,7 @@ class PandasDataFrameContainer(
             import pyarrow.plasma as plasma
 
             assert plasma_db
-            return plasma_db.get(plasma.ObjectID(payload.data))
+            return plasma_db.get(plasma.ObjectID(bytes(payload.data)))
 
         return pickle.loads(payload.data)
 
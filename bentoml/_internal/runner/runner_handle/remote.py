@@ -1,131 +1,347 @@
 from __future__ import annotations
 
-import json
-import pickle
+import socket
 import typing as t
 import asyncio
-import functools
+import threading
 from typing import TYPE_CHECKING
 from json.decoder import JSONDecodeError
-from urllib.parse import urlparse
+
+import attr
+import yarl
+import anyio
+import aiohttp
+from multidict import CIMultiDict
+from opentelemetry.instrumentation.aiohttp_client import (
+    create_trace_config,  # type: ignore (missing type stubs)
+)
 
 from . import RunnerHandle
+from ...types import LazyType
 from ...context import component_context
 from ..container import Payload
+from ..container import AutoContainer
 from ...utils.uri import uri_to_path
 from ....exceptions import RemoteException
 from ...runner.utils import Params
 from ...runner.utils import PAYLOAD_META_HEADER
+from ...runner.utils import payload_params_to_header
+from ...runner.utils import payload_params_to_pickle
+from ...runner.utils import msgpack_to_payload_results
+from ...runner.utils import payload_paramss_to_msgpack
+from ...runner.utils import PAYLOAD_PARAMS_PICKLE_CONTENT_TYPE
+from ...runner.utils import PAYLOAD_PARAMS_MSGPACK_CONTENT_TYPE
 from ...configuration.containers import BentoMLContainer
 
 if TYPE_CHECKING:  # pragma: no cover
+    from aiohttp import TraceConfig
     from aiohttp import BaseConnector
     from aiohttp.client import ClientSession
+    from aiohttp.client import ClientResponse
 
+    from ... import external_typing as ext
     from ..runner import Runner
     from ..runner import RunnerMethod
 
     P = t.ParamSpec("P")
     R = t.TypeVar("R")
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional, but much faster decoding payload metas
+    from json import loads as json_loads
+
+PAYLOAD_CONTENT_TYPE_PREFIX = "application/vnd.bentoml."
+# inputs larger than this are converted to payloads in the default executor
+TO_PAYLOAD_IN_EXECUTOR_MIN_BYTES = 32 * 1024
+# only this much of an error response body is included in the raised exception
+ERROR_EXCERPT_MAX_BYTES = 1024
+
+
+_thread_state = threading.local()
+
+
+def _error_excerpt(body: bytes | bytearray) -> str:
+    # error bodies may be large (e.g. proxy error pages) or not even text
+    return body[:ERROR_EXCERPT_MAX_BYTES].decode(errors="replace")
+
+
+def _estimate_nbytes(arg: t.Any) -> int:
+    """
+    A cheap estimate of the size of an input once serialized, 0 when it is unknown.
+    """
+    if LazyType["ext.PdDataFrame"]("pandas.DataFrame").isinstance(arg):
+        # DataFrames have no nbytes, a shallow memory usage is cheap to compute
+        return int(arg.memory_usage(index=True).sum())
+    return getattr(arg, "nbytes", 0)
+
+
+def _payload_container(content_type: str) -> str | None:
+    """
+    The name of the container of a runner response payload, from its Content-Type.
+    """
+    if not content_type.lower().startswith(PAYLOAD_CONTENT_TYPE_PREFIX):
+        return None
+    # container names are case sensitive, only the prefix is matched loosely
+    return content_type[len(PAYLOAD_CONTENT_TYPE_PREFIX) :]
+
+
+def _strip_query_params(url: yarl.URL) -> str:
+    return str(url.with_query(None))
+
+
+def _in_anyio_worker_thread() -> bool:
+    """
+    Whether the current thread is an AnyIO worker thread, i.e. has an event loop to
+    delegate to. It is probed only once per thread, as threads never change kind.
+    """
+    is_worker: bool | None = getattr(_thread_state, "is_anyio_worker", None)
+    if is_worker is None:
+        try:
+            anyio.from_thread.run_sync(lambda: None)
+            is_worker = True
+        except RuntimeError:
+            is_worker = False
+        _thread_state.is_anyio_worker = is_worker
+    return is_worker
+
+
+class _KeepAliveTCPConnector(aiohttp.TCPConnector):
+    """
+    A TCPConnector enabling TCP keepalive on its connections, so that long idle pooled
+    connections are probed instead of being silently dropped by middleboxes.
+    asyncio already sets TCP_NODELAY on TCP transports.
+    """
+
+    async def _create_connection(self, *args: t.Any, **kwargs: t.Any) -> t.Any:
+        proto = await super()._create_connection(*args, **kwargs)  # type: ignore (private API)
+        sock = proto.transport.get_extra_info("socket") if proto.transport else None
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        return proto
+
+
+@attr.define(eq=False)
+class _PendingBatches:
+    """
+    The calls of a client waiting to be batched in an event loop, and the tasks
+    flushing and sending them, per runner method.
+    """
+
+    loop: asyncio.AbstractEventLoop
+    queues: dict[
+        str, asyncio.Queue[tuple[Params[Payload], asyncio.Future[Payload]]]
+    ] = attr.Factory(dict)
+    flushers: dict[str, asyncio.Task[None]] = attr.Factory(dict)
+    senders: set[asyncio.Task[None]] = attr.Factory(set)
+
+
+@attr.define(eq=False)
+class _LoopSession:
+    """
+    The connection pool and session of a client in one event loop, aiohttp objects
+    can only be used in the loop they were created in.
+    """
+
+    loop: asyncio.AbstractEventLoop
+    conn: BaseConnector
+    session: ClientSession
+
+    async def close(self) -> None:
+        await self.session.close()
+        await self.conn.close()
+
 
 class RemoteRunnerClient(RunnerHandle):
+    # event loop running in a daemon thread, for run_method calls from plain threads
+    _bg_loop: t.ClassVar[asyncio.AbstractEventLoop | None] = None
+    _bg_loop_lock: t.ClassVar[threading.Lock] = threading.Lock()
+    # shared by all the sessions, built on first use once tracing is configured
+    _trace_config: t.ClassVar[TraceConfig | None] = None
+
     def __init__(self, runner: Runner):  # pylint: disable=super-init-not-called
         self._runner = runner
-        self._conn: BaseConnector | None = None
-        self._client_cache: ClientSession | None = None
-        self._loop: asyncio.AbstractEventLoop | None = None
-        self._addr: str | None = None
+        # connection pools and sessions by id of their event loop: run_method calls
+        # from plain threads run in a different loop than async_run_method calls
+        self._sessions: dict[int, _LoopSession] = {}
+        self._sessions_lock = threading.Lock()
+        self._remote_runner_server_map_cache: dict[str, str] | None = None
+        self._runner_config_cache: dict[str, t.Any] | None = None
+        self._bind_target_cache: tuple[str, str] | None = None
+        # parsed once, aiohttp uses yarl.URL objects as they are; they don't depend on
+        # the event loop, so one cache serves all the sessions of the client
+        self._url_cache: dict[str, yarl.URL] = {}
+        self._static_headers: CIMultiDict[str] | None = None
+        # pending calls by id of their event loop, when client batching is on
+        self._batches: dict[int, _PendingBatches] = {}
 
     @property
     def _remote_runner_server_map(self) -> dict[str, str]:
-        return BentoMLContainer.remote_runner_mapping.get()
+        if self._remote_runner_server_map_cache is None:
+            self._remote_runner_server_map_cache = (
+                BentoMLContainer.remote_runner_mapping.get()
+            )
+        return self._remote_runner_server_map_cache
+
+    @property
+    def _runner_config(self) -> dict[str, t.Any]:
+        # runners configuration is immutable after startup, only resolve it once
+        if self._runner_config_cache is None:
+            runner_cfg = BentoMLContainer.runners_config.get()
+            if self._runner.name in runner_cfg:
+                self._runner_config_cache = runner_cfg[self._runner.name]
+            else:
+                self._runner_config_cache = runner_cfg
+        return self._runner_config_cache
 
     @property
     def runner_timeout(self) -> int:
         "return the configured timeout for this runner."
-        runner_cfg = BentoMLContainer.runners_config.get()
-        if self._runner.name in runner_cfg:
-            return runner_cfg[self._runner.name]["timeout"]
-        else:
-            return runner_cfg["timeout"]
+        return self._runner_config["timeout"]
 
-    def _close_conn(self) -> None:
-        if self._conn:
-            self._conn.close()
+    @property
+    def runner_serialization(self) -> str:
+        "return the configured wire format for this runner's requests."
+        return self._runner_config["serialization"]
 
-    def _get_conn(self) -> BaseConnector:
-        import aiohttp
+    @property
+    def client_batching_config(self) -> dict[str, t.Any]:
+        "return the configured client side batching options for this runner."
+        return self._runner_config["client_batching"]
 
-        if (
-            self._loop is None
-            or self._conn is None
-            or self._conn.closed
-            or self._loop.is_closed()
-        ):
-            self._loop = asyncio.get_event_loop()  # get the loop lazily
+    @property
+    def _headers(self) -> CIMultiDict[str]:
+        # these are immutable for the lifetime of the client, build them only once
+        if self._static_headers is None:
+            self._static_headers = CIMultiDict(
+                {
+                    "Bento-Name": component_context.bento_name,
+                    "Bento-Version": component_context.bento_version,
+                    "Runner-Name": self._runner.name,
+                    "Yatai-Bento-Deployment-Name": component_context.yatai_bento_deployment_name,
+                    "Yatai-Bento-Deployment-Namespace": component_context.yatai_bento_deployment_namespace,
+                }
+            )
+        return self._static_headers
+
+    @property
+    def _bind_target(self) -> tuple[str, str]:
+        """
+        The bind scheme of the remote runner, with its socket path or network location.
+        """
+        if self._bind_target_cache is None:
             bind_uri = self._remote_runner_server_map[self._runner.name]
-            parsed = urlparse(bind_uri)
-            if parsed.scheme == "file":
-                path = uri_to_path(bind_uri)
-                self._conn = aiohttp.UnixConnector(
-                    path=path,
-                    loop=self._loop,
-                    limit=800,  # TODO(jiang): make it configurable
-                    keepalive_timeout=1800.0,
-                )
-                self._addr = "http://127.0.0.1:8000"  # addr doesn't matter with UDS
-            elif parsed.scheme == "tcp":
-                self._conn = aiohttp.TCPConnector(
-                    loop=self._loop,
-                    verify_ssl=False,
-                    limit=800,  # TODO(jiang): make it configurable
-                    keepalive_timeout=1800.0,
-                )
-                self._addr = f"http://{parsed.netloc}"
+            if bind_uri.startswith("file:"):
+                self._bind_target_cache = ("file", uri_to_path(bind_uri))
+            elif bind_uri.startswith("tcp://"):
+                netloc = bind_uri[len("tcp://") :].split("/", 1)[0]
+                self._bind_target_cache = ("tcp", netloc)
             else:
-                raise ValueError(f"Unsupported bind scheme: {parsed.scheme}")
-        return self._conn
+                scheme = bind_uri.split(":", 1)[0]
+                raise ValueError(f"Unsupported bind scheme: {scheme}")
+        return self._bind_target_cache
 
-    @property
-    def _client(
-        self,
+    def _new_conn(self, loop: asyncio.AbstractEventLoop) -> BaseConnector:
+        scheme, target = self._bind_target
+        if scheme == "file":
+            return aiohttp.UnixConnector(
+                path=target,
+                loop=loop,
+                limit=self._runner_config["connection_limit"],
+                limit_per_host=self._runner_config["per_host_limit"],
+                keepalive_timeout=1800.0,
+            )
+        return _KeepAliveTCPConnector(
+            loop=loop,
+            verify_ssl=False,
+            limit=self._runner_config["connection_limit"],
+            limit_per_host=self._runner_config["per_host_limit"],
+            keepalive_timeout=1800.0,
+            force_close=False,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+        )
+
+    def _new_session(
+        self, loop: asyncio.AbstractEventLoop, conn: BaseConnector
     ) -> ClientSession:
-        import aiohttp
+        cls = type(self)
+        if cls._trace_config is None:
+            cls._trace_config = create_trace_config(
+                # Remove all query params from the URL attribute on the span.
+                url_filter=_strip_query_params,  # type: ignore
+                tracer_provider=BentoMLContainer.tracer_provider.get(),
+            )
+        timeout = aiohttp.ClientTimeout(total=self.runner_timeout)
+        return aiohttp.ClientSession(
+            trace_configs=[cls._trace_config],
+            connector=conn,
+            auto_decompress=False,
+            # cookie jars are bound to the loop they are created in
+            cookie_jar=aiohttp.DummyCookieJar(loop=loop),
+            connector_owner=False,
+            timeout=timeout,
+            loop=loop,
+            trust_env=True,
+        )
 
+    @property
+    def _addr(self) -> str:
+        scheme, target = self._bind_target
+        if scheme == "file":
+            return "http://127.0.0.1:8000"  # addr doesn't matter with UDS
+        return f"http://{target}"
+
+    def _get_loop_session(self) -> _LoopSession:
+        loop = asyncio.get_event_loop()  # get the loop lazily
+        sess = self._sessions.get(id(loop))
         if (
-            self._loop is None
-            or self._client_cache is None
-            or self._client_cache.closed
-            or self._loop.is_closed()
+            sess is None
+            or sess.loop is not loop
+            or sess.conn.closed
+            or sess.session.closed
         ):
-            import yarl
-            from opentelemetry.instrumentation.aiohttp_client import (
-                create_trace_config,  # type: ignore (missing type stubs)
-            )
+            with self._sessions_lock:
+                # forget the sessions of finished loops, their ids can be reused
+                for key in [k for k, v in self._sessions.items() if v.loop.is_closed()]:
+                    del self._sessions[key]
+                conn = self._new_conn(loop)
+                sess = _LoopSession(loop, conn, self._new_session(loop, conn))
+                self._sessions[id(loop)] = sess
+        return sess
 
-            def strip_query_params(url: yarl.URL) -> str:
-                return str(url.with_query(None))
-
-            jar = aiohttp.DummyCookieJar()
-            timeout = aiohttp.ClientTimeout(total=self.runner_timeout)
-            self._client_cache = aiohttp.ClientSession(
-                trace_configs=[
-                    create_trace_config(
-                        # Remove all query params from the URL attribute on the span.
-                        url_filter=strip_query_params,  # type: ignore
-                        tracer_provider=BentoMLContainer.tracer_provider.get(),
-                    )
-                ],
-                connector=self._get_conn(),
-                auto_decompress=False,
-                cookie_jar=jar,
-                connector_owner=False,
-                timeout=timeout,
-                loop=self._loop,
-                trust_env=True,
-            )
-        return self._client_cache
+    def _close_sessions(self) -> None:
+        with self._sessions_lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for sess in sessions:
+            # sessions can only be closed in their own loop, which may run in another
+            # thread; the connections of closed loops are already gone
+            if sess.loop.is_running():
+                asyncio.run_coroutine_threadsafe(sess.close(), sess.loop)
+
+    def _get_conn(self) -> BaseConnector:
+        return self._get_loop_session().conn
+
+    @property
+    def _client(
+        self,
+    ) -> ClientSession:
+        return self._get_loop_session().session
+
+    @staticmethod
+    async def _read_body(resp: ClientResponse) -> bytes | bytearray:
+        content_length = resp.content_length
+        if resp.status != 200 or content_length is None:
+            return await resp.read()
+        # Read into a preallocated buffer; resp.read() keeps all the chunks around
+        # while joining them, doubling the peak memory usage for large outputs.
+        body = bytearray(content_length)
+        pos = 0
+        async for chunk in resp.content.iter_chunked(65536):
+            body[pos : pos + len(chunk)] = chunk
+            pos += len(chunk)
+        return body
 
     async def async_run_method(
         self,
@@ -133,87 +349,253 @@ class RemoteRunnerClient(RunnerHandle):
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> R:
-        from ...runner.container import AutoContainer
-
         inp_batch_dim = __bentoml_method.config.batch_dim[0]
 
-        payload_params = Params[Payload](*args, **kwargs).map(
-            functools.partial(AutoContainer.to_payload, batch_dim=inp_batch_dim)
-        )
+        params = Params[t.Any](*args, **kwargs)
+        container_to_payload = AutoContainer.to_payload
 
-        if __bentoml_method.config.batchable:
-            if not payload_params.map(lambda i: i.batch_size).all_equal():
-                raise ValueError(
-                    "All batchable arguments must have the same batch size."
-                )
+        def to_payload(arg: t.Any) -> Payload:
+            return container_to_payload(arg, batch_dim=inp_batch_dim)
+
+        # only array-likes and DataFrames are sized, other inputs are considered small
+        nbytes = sum(_estimate_nbytes(arg) for _, arg in params.items())
+        if nbytes < TO_PAYLOAD_IN_EXECUTOR_MIN_BYTES:
+            payload_params = params.map(to_payload)
+        else:
+            # serializing large inputs would block the event loop, and all the other
+            # in-flight requests with it
+            payload_params = await asyncio.get_running_loop().run_in_executor(
+                None, params.map, to_payload
+            )
+
+        if (
+            __bentoml_method.config.batchable
+            and not payload_params.all_batch_sizes_equal()
+        ):
+            raise ValueError("All batchable arguments must have the same batch size.")
 
-        path = "" if __bentoml_method.name == "__call__" else __bentoml_method.name
-        async with self._client.post(
-            f"{self._addr}/{path}",
-            data=pickle.dumps(payload_params),  # FIXME: pickle inside pickle
-            headers={
-                "Bento-Name": component_context.bento_name,
-                "Bento-Version": component_context.bento_version,
-                "Runner-Name": self._runner.name,
-                "Yatai-Bento-Deployment-Name": component_context.yatai_bento_deployment_name,
-                "Yatai-Bento-Deployment-Namespace": component_context.yatai_bento_deployment_namespace,
-            },
+        if self.client_batching_config["enabled"]:
+            payload = await self._batched_run(__bentoml_method, payload_params)
+            return AutoContainer.from_payload(payload)
+
+        # A header with the arguments structure, followed by the raw payload data as-is,
+        # so that they are streamed without being copied.
+        if self.runner_serialization == "pickle":
+            header, datas = payload_params_to_pickle(payload_params)
+            header_type = PAYLOAD_PARAMS_PICKLE_CONTENT_TYPE
+        else:
+            header = payload_params_to_header(payload_params)
+            datas = [payload.data for _, payload in payload_params.items()]
+            header_type = PAYLOAD_PARAMS_MSGPACK_CONTENT_TYPE
+        data = aiohttp.MultipartWriter("mixed")
+        data.append(header, {"Content-Type": header_type})
+        for d in datas:
+            data.append(d, {"Content-Type": "application/octet-stream"})
+
+        client = self._client
+        url = self._url_cache.get(__bentoml_method.name)
+        if url is None:
+            path = "" if __bentoml_method.name == "__call__" else __bentoml_method.name
+            url = self._url_cache[__bentoml_method.name] = yarl.URL(
+                f"{self._addr}/{path}"
+            )
+        async with client.post(
+            url,
+            data=data,
+            headers=self._headers,
         ) as resp:
-            body = await resp.read()
+            body = await self._read_body(resp)
 
         if resp.status != 200:
             raise RemoteException(
-                f"An exception occurred in remote runner {self._runner.name}: [{resp.status}] {body.decode()}"
+                f"An exception occurred in remote runner {self._runner.name}: [{resp.status}] {_error_excerpt(body)}"
             )
 
-        try:
-            meta_header = resp.headers[PAYLOAD_META_HEADER]
-        except KeyError:
-            raise RemoteException(
-                f"Bento payload decode error: {PAYLOAD_META_HEADER} header not set. "
-                "An exception might have occurred in the remote server."
-                f"[{resp.status}] {body.decode()}"
-            ) from None
-
-        try:
-            content_type = resp.headers["Content-Type"]
-        except KeyError:
+        headers = resp.headers
+        meta_header = headers.get(PAYLOAD_META_HEADER)
+        content_type = headers.get("Content-Type")
+        if meta_header is None or content_type is None:
+            missing = PAYLOAD_META_HEADER if meta_header is None else "Content-Type"
             raise RemoteException(
-                f"Bento payload decode error: Content-Type header not set. "
+                f"Bento payload decode error: {missing} header not set. "
                 "An exception might have occurred in the remote server."
-                f"[{resp.status}] {body.decode()}"
-            ) from None
+                f"[{resp.status}] {_error_excerpt(body)}"
+            )
 
-        if not content_type.lower().startswith("application/vnd.bentoml."):
+        container = _payload_container(content_type)
+        if container is None:
             raise RemoteException(
                 f"Bento payload decode error: invalid Content-Type '{content_type}'."
             )
 
-        container = content_type.strip("application/vnd.bentoml.")
-
         try:
             payload = Payload(
-                data=body, meta=json.loads(meta_header), container=container
+                data=body, meta=json_loads(meta_header), container=container
             )
         except JSONDecodeError:
             raise ValueError(f"Bento payload decode error: {meta_header}")
 
         return AutoContainer.from_payload(payload)
 
+    async def _batched_run(
+        self,
+        runner_method: RunnerMethod[t.Any, t.Any, t.Any],
+        payload_params: Params[Payload],
+    ) -> Payload:
+        """
+        Queue a call to be sent along with the other calls of the same method arriving
+        within max_latency_ms, in a single request to the runner batch endpoint.
+        """
+        loop = asyncio.get_running_loop()
+        batches = self._batches.get(id(loop))
+        if batches is None:
+            # queued calls can't outlive the loop they were created in
+            for k in [k for k, v in self._batches.items() if v.loop.is_closed()]:
+                del self._batches[k]
+            batches = self._batches[id(loop)] = _PendingBatches(loop)
+
+        name = runner_method.name
+        queue = batches.queues.get(name)
+        if queue is None:
+            queue = batches.queues[name] = asyncio.Queue()
+
+        fut: asyncio.Future[Payload] = loop.create_future()
+        queue.put_nowait((payload_params, fut))
+
+        flusher = batches.flushers.get(name)
+        if flusher is None or flusher.done():
+            batches.flushers[name] = asyncio.ensure_future(
+                self._flush_batches(runner_method, queue, batches.senders)
+            )
+        return await fut
+
+    async def _flush_batches(
+        self,
+        runner_method: RunnerMethod[t.Any, t.Any, t.Any],
+        queue: asyncio.Queue[tuple[Params[Payload], asyncio.Future[Payload]]],
+        senders: set[asyncio.Task[None]],
+    ) -> None:
+        config = self.client_batching_config
+        max_batch_size: int = config["max_batch_size"]
+        max_latency = config["max_latency_ms"] / 1000
+
+        def take(n: int) -> list[tuple[Params[Payload], asyncio.Future[Payload]]]:
+            return [queue.get_nowait() for _ in range(min(n, queue.qsize()))]
+
+        # There is no await between the last emptiness check and the return of this
+        # task, so a call queued after that always finds this flusher done.
+        while not queue.empty():
+            batch = take(max_batch_size)
+            if len(batch) < max_batch_size:
+                await asyncio.sleep(max_latency)
+                batch.extend(take(max_batch_size - len(batch)))
+            sender = asyncio.ensure_future(self._send_batch(runner_method, batch))
+            senders.add(sender)  # keep a reference until it is done
+            sender.add_done_callback(senders.discard)
+
+    async def _send_batch(
+        self,
+        runner_method: RunnerMethod[t.Any, t.Any, t.Any],
+        batch: list[tuple[Params[Payload], asyncio.Future[Payload]]],
+    ) -> None:
+        futures = [fut for _, fut in batch]
+        try:
+            results = await self._post_batch(
+                runner_method, [params for params, _ in batch]
+            )
+        except asyncio.CancelledError:
+            for fut in futures:
+                fut.cancel()
+            raise
+        except Exception as e:  # pylint: disable=broad-except
+            for fut in futures:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+
+        for fut, result in zip(futures, results):
+            if fut.done():  # the caller has been cancelled
+                continue
+            if isinstance(result, str):
+                fut.set_exception(
+                    RemoteException(
+                        f"An exception occurred in remote runner {self._runner.name}: {result}"
+                    )
+                )
+            else:
+                fut.set_result(result)
+
+    async def _post_batch(
+        self,
+        runner_method: RunnerMethod[t.Any, t.Any, t.Any],
+        paramss: list[Params[Payload]],
+    ) -> list[Payload | str]:
+        client = self._client
+        key = f"__batch__/{runner_method.name}"
+        url = self._url_cache.get(key)
+        if url is None:
+            url = self._url_cache[key] = yarl.URL(f"{self._addr}/{key}")
+        async with client.post(
+            url,
+            data=payload_paramss_to_msgpack(paramss),
+            headers=self._headers,
+        ) as resp:
+            body = await self._read_body(resp)
+
+        if resp.status != 200:
+            raise RemoteException(
+                f"An exception occurred in remote runner {self._runner.name}: [{resp.status}] {_error_excerpt(body)}"
+            )
+
+        results = msgpack_to_payload_results(body)
+        if len(results) != len(paramss):
+            raise RemoteException(
+                f"Bento payload decode error: expected {len(paramss)} results from"
+                f" remote runner {self._runner.name}, got {len(results)}."
+            )
+        return results
+
     def run_method(
         self,
         __bentoml_method: RunnerMethod[t.Any, P, R],
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> R:
-        import anyio
-
-        return anyio.from_thread.run(  # type: ignore (pyright cannot infer the return type)
-            self.async_run_method,
-            __bentoml_method,
-            *args,
-            **kwargs,
+        if _in_anyio_worker_thread():
+            # e.g. sync APIs of the API server: run in the server's event loop, where
+            # the client session lives
+            return anyio.from_thread.run(  # type: ignore (pyright cannot infer the return type)
+                self.async_run_method,
+                __bentoml_method,
+                *args,
+                **kwargs,
+            )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:  # a plain thread
+            return asyncio.run_coroutine_threadsafe(
+                self.async_run_method(__bentoml_method, *args, **kwargs),
+                self._get_bg_loop(),
+            ).result()
+        # waiting for the result here would block the running event loop
+        raise RuntimeError(
+            f"Runner {self._runner.name} can't be run synchronously from within an"
+            " event loop, use `async_run` instead."
         )
 
+    @classmethod
+    def _get_bg_loop(cls) -> asyncio.AbstractEventLoop:
+        if cls._bg_loop is None:
+            with cls._bg_loop_lock:
+                if cls._bg_loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever,
+                        name="bentoml-remote-runner-loop",
+                        daemon=True,
+                    ).start()
+                    cls._bg_loop = loop
+        return cls._bg_loop
+
     def __del__(self) -> None:
-        self._close_conn()
+        self._close_sessions()
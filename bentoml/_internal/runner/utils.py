@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import pickle
 import typing as t
 import logging
 import itertools
 from typing import TYPE_CHECKING
 
+import msgpack
+
 from bentoml.exceptions import InvalidArgument
 
 logger = logging.getLogger(__name__)
@@ -57,6 +60,15 @@ class Params(t.Generic[T]):
         _, first = next(value_iter)
         return all(v == first for _, v in value_iter)
 
+    def all_batch_sizes_equal(self: Params[Payload]) -> bool:
+        """
+        Check that all the Payloads in the Params have the same batch size, in a single
+        pass over the values.
+        """
+        batch_size_iter = (v.batch_size for _, v in self.items())
+        first = next(batch_size_iter, None)
+        return all(b == first for b in batch_size_iter)
+
     def map(self, function: t.Callable[[T], To]) -> Params[To]:
         """
         Apply a function to all the values in the Params and return a Params of the
@@ -116,6 +128,149 @@ class Params(t.Generic[T]):
 
 
 PAYLOAD_META_HEADER = "Bento-Payload-Meta"
+PAYLOAD_PARAMS_MSGPACK_CONTENT_TYPE = "application/vnd.bentoml.msgpack"
+PAYLOAD_PARAMS_PICKLE_CONTENT_TYPE = "application/vnd.bentoml.pickle"
+
+
+def _payload_to_header(payload: Payload) -> dict[str, t.Any]:
+    return {
+        "meta": payload.meta,
+        "container": payload.container,
+        "batch_size": payload.batch_size,
+    }
+
+
+def _pack_payload(obj: t.Any) -> t.Any:
+    """
+    msgpack ``default`` hook, describing the structure of a Params[Payload] without
+    the payload data itself.
+    """
+    if isinstance(obj, Params):
+        return {
+            "args": [_payload_to_header(p) for p in obj.args],
+            "kwargs": {k: _payload_to_header(p) for k, p in obj.kwargs.items()},
+        }
+    raise TypeError(f"Object of type {type(obj).__name__} is not msgpack serializable")
+
+
+def payload_params_to_header(params: Params[Payload]) -> bytes:
+    """
+    Encode the arguments structure and metadata of a Params[Payload]. The payload data
+    are expected to be sent alongside as raw parts, in the order of ``params.items()``.
+    """
+    return msgpack.packb(params, default=_pack_payload, use_bin_type=True)
+
+
+def header_to_payload_params(
+    header: bytes, datas: t.Sequence[bytes]
+) -> Params[Payload]:
+    """
+    Inverse of ``payload_params_to_header``, zipping the decoded metadata with the raw
+    payload data.
+    """
+    from ..runner.container import Payload
+
+    packed = msgpack.unpackb(header, raw=False)
+    n_args = len(packed["args"])
+    if n_args + len(packed["kwargs"]) != len(datas):
+        raise ValueError(
+            f"Expected {n_args + len(packed['kwargs'])} payload parts, got {len(datas)}"
+        )
+    return Params[Payload](
+        *(Payload(data, **p) for p, data in zip(packed["args"], datas)),
+        **{
+            k: Payload(data, **p)
+            for (k, p), data in zip(packed["kwargs"].items(), datas[n_args:])
+        },
+    )
+
+
+def payload_params_to_pickle(
+    params: Params[Payload],
+) -> tuple[bytes, list[memoryview]]:
+    """
+    Pickle a Params[Payload] with the payload data as out-of-band buffers, which are
+    expected to be sent alongside as raw parts instead of being copied into the pickle.
+    """
+    if pickle.HIGHEST_PROTOCOL < 5:  # Python 3.7, no out-of-band buffers support
+        return pickle.dumps(params), []
+
+    buffers: list[pickle.PickleBuffer] = []
+    header = pickle.dumps(
+        params.map(lambda p: p._replace(data=pickle.PickleBuffer(p.data))),
+        protocol=5,
+        buffer_callback=buffers.append,
+    )
+    return header, [b.raw() for b in buffers]
+
+
+def pickle_to_payload_params(
+    header: bytes, datas: t.Sequence[bytes]
+) -> Params[Payload]:
+    if not datas:  # no out-of-band buffers, which Python 3.7 doesn't support anyway
+        return pickle.loads(header)
+    return pickle.loads(header, buffers=datas)
+
+
+def _payload_to_dict(payload: Payload) -> dict[str, t.Any]:
+    return {"data": payload.data, **_payload_to_header(payload)}
+
+
+def payload_paramss_to_msgpack(paramss: t.Sequence[Params[Payload]]) -> bytes:
+    """
+    Encode the Params[Payload] of several calls, payload data included, into a single
+    body for the runner batch endpoint.
+    """
+    return msgpack.packb(
+        {
+            "calls": [
+                {
+                    "args": [_payload_to_dict(p) for p in params.args],
+                    "kwargs": {
+                        k: _payload_to_dict(p) for k, p in params.kwargs.items()
+                    },
+                }
+                for params in paramss
+            ]
+        },
+        use_bin_type=True,
+    )
+
+
+def msgpack_to_payload_paramss(data: bytes) -> list[Params[Payload]]:
+    from ..runner.container import Payload
+
+    packed = msgpack.unpackb(data, raw=False)
+    return [
+        Params[Payload](
+            *(Payload(**p) for p in call["args"]),
+            **{k: Payload(**p) for k, p in call["kwargs"].items()},
+        )
+        for call in packed["calls"]
+    ]
+
+
+def payload_results_to_msgpack(results: t.Sequence[Payload | str]) -> bytes:
+    """
+    Encode the results of the calls sent to the runner batch endpoint, in order. A
+    ``str`` result is the error message of a call that failed.
+    """
+    return msgpack.packb(
+        {
+            "results": [
+                {"error": r} if isinstance(r, str) else _payload_to_dict(r)
+                for r in results
+            ]
+        },
+        use_bin_type=True,
+    )
+
+
+def msgpack_to_payload_results(data: bytes) -> list[Payload | str]:
+    from ..runner.container import Payload
+
+    packed = msgpack.unpackb(data, raw=False)
+    return [r["error"] if "error" in r else Payload(**r) for r in packed["results"]]
 
 
 def payload_paramss_to_batch_params(
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import pickle
 import typing as t
+import asyncio
 import logging
 import functools
 from typing import TYPE_CHECKING
@@ -11,7 +12,13 @@ from functools import partial
 from ..context import trace_context
 from ..runner.utils import Params
 from ..runner.utils import PAYLOAD_META_HEADER
+from ..runner.utils import header_to_payload_params
+from ..runner.utils import pickle_to_payload_params
+from ..runner.utils import msgpack_to_payload_paramss
+from ..runner.utils import payload_results_to_msgpack
 from ..runner.utils import payload_paramss_to_batch_params
+from ..runner.utils import PAYLOAD_PARAMS_PICKLE_CONTENT_TYPE
+from ..runner.utils import PAYLOAD_PARAMS_MSGPACK_CONTENT_TYPE
 from ..server.base_app import BaseAppFactory
 from ..runner.container import AutoContainer
 from ..marshal.dispatcher import CorkDispatcher
@@ -29,6 +36,116 @@ if TYPE_CHECKING:
 
     from ..runner.runner import Runner
     from ..runner.runner import RunnerMethod
+    from ..runner.container import Payload
+
+
+async def _read_multipart_parts(request: Request) -> list[tuple[bytes, bytes]]:
+    """
+    Read all the parts of a multipart request body, as (Content-Type, data) pairs.
+    """
+    import multipart.multipart as multipart
+
+    _, options = multipart.parse_options_header(request.headers.get("Content-Type"))
+    boundary = options.get(b"boundary")
+    if not boundary:
+        raise ValueError("no multipart boundary in the request Content-Type")
+    parts: list[tuple[bytes, bytes]] = []
+    chunks: list[bytes] = []
+    header_field = bytearray()
+    header_value = bytearray()
+    content_type = b""
+
+    def on_part_begin() -> None:
+        nonlocal content_type
+        content_type = b""
+
+    def on_header_field(data: bytes, start: int, end: int) -> None:
+        header_field.extend(data[start:end])
+
+    def on_header_value(data: bytes, start: int, end: int) -> None:
+        header_value.extend(data[start:end])
+
+    def on_header_end() -> None:
+        nonlocal content_type
+        if header_field.lower() == b"content-type":
+            content_type = bytes(header_value)
+        header_field.clear()
+        header_value.clear()
+
+    def on_part_data(data: bytes, start: int, end: int) -> None:
+        chunks.append(data[start:end])
+
+    def on_part_end() -> None:
+        parts.append((content_type, b"".join(chunks)))
+        chunks.clear()
+
+    parser = multipart.MultipartParser(
+        boundary,
+        {
+            "on_part_begin": on_part_begin,
+            "on_header_field": on_header_field,
+            "on_header_value": on_header_value,
+            "on_header_end": on_header_end,
+            "on_part_data": on_part_data,
+            "on_part_end": on_part_end,
+        },
+    )
+    async for chunk in request.stream():
+        parser.write(chunk)
+    parser.finalize()
+    return parts
+
+
+async def _read_payload_params(
+    request: Request, allow_pickle: bool = False
+) -> Params[Payload]:
+    from starlette.exceptions import HTTPException
+
+    try:
+        (header_type, header), *parts = await _read_multipart_parts(request)
+        datas = [data for _, data in parts]
+        if header_type.decode("latin-1") == PAYLOAD_PARAMS_PICKLE_CONTENT_TYPE:
+            # unpickling can run arbitrary code, only accept it from runner clients
+            # that are configured to send it
+            if not allow_pickle:
+                raise HTTPException(
+                    400, "pickle serialization is not enabled for this runner"
+                )
+            return pickle_to_payload_params(header, datas)
+        return header_to_payload_params(header, datas)
+    except (ValueError, pickle.UnpicklingError) as e:
+        # e.g. a body that is not multipart, or has fewer parts than payloads
+        raise HTTPException(400, f"Invalid runner request body: {e}")
+
+
+async def _run_payloads(
+    runner_method: RunnerMethod[t.Any, t.Any, t.Any],
+    params: Params[Payload],
+) -> Payload:
+    params = params.map(AutoContainer.from_payload)
+    ret = await runner_method.async_run(*params.args, **params.kwargs)
+    return AutoContainer.to_payload(ret, 0)
+
+
+async def _run_batch_payloads(
+    runner_method: RunnerMethod[t.Any, t.Any, t.Any],
+    params_list: t.Sequence[Params[Payload]],
+) -> list[Payload]:
+    input_batch_dim, output_batch_dim = runner_method.config.batch_dim
+
+    batched_params, indices = payload_paramss_to_batch_params(
+        params_list, input_batch_dim
+    )
+
+    batch_ret = await runner_method.async_run(
+        *batched_params.args, **batched_params.kwargs
+    )
+
+    return AutoContainer.batch_to_payloads(
+        batch_ret,
+        indices,
+        batch_dim=output_batch_dim,
+    )
 
 
 class RunnerAppFactory(BaseAppFactory):
@@ -40,6 +157,11 @@ class RunnerAppFactory(BaseAppFactory):
         self.runner = runner
         self.worker_index = worker_index
 
+        runners_config = BentoMLContainer.runners_config.get()
+        runner_config = runners_config.get(runner.name, runners_config)
+        # see the "serialization" runner configuration
+        self.allow_pickle = runner_config["serialization"] == "pickle"
+
         from starlette.responses import Response
 
         TooManyRequests = partial(Response, status_code=429)
@@ -87,6 +209,9 @@ class RunnerAppFactory(BaseAppFactory):
         For method in self.runner.runner_methods:
         /{method.name}  Run corresponding runnable method
         /               Run the runnable method "__call__" if presented
+        /__batch__/{method.name}
+                        Run several calls of the runnable method sent at once by a
+                        remote runner client with client_batching enabled
         """
         from starlette.routing import Route
 
@@ -112,6 +237,13 @@ class RunnerAppFactory(BaseAppFactory):
                         methods=["POST"],
                     )
                 )
+            routes.append(
+                Route(
+                    path=f"/__batch__/{method.name}",
+                    endpoint=self.async_run_batch(runner_method=method),
+                    methods=["POST"],
+                )
+            )
         return routes
 
     @property
@@ -168,24 +300,9 @@ class RunnerAppFactory(BaseAppFactory):
                 return []
             params_list: list[Params[t.Any]] = []
             for r in requests:
-                r_ = await r.body()
-                params_list.append(pickle.loads(r_))
-
-            input_batch_dim, output_batch_dim = runner_method.config.batch_dim
+                params_list.append(await _read_payload_params(r, self.allow_pickle))
 
-            batched_params, indices = payload_paramss_to_batch_params(
-                params_list, input_batch_dim
-            )
-
-            batch_ret = await runner_method.async_run(
-                *batched_params.args, **batched_params.kwargs
-            )
-
-            payloads = AutoContainer.batch_to_payloads(
-                batch_ret,
-                indices,
-                batch_dim=output_batch_dim,
-            )
+            payloads = await _run_batch_payloads(runner_method, params_list)
 
             return [
                 Response(
@@ -210,12 +327,9 @@ class RunnerAppFactory(BaseAppFactory):
         async def _run(request: Request) -> Response:
             assert self._is_ready
 
-            params = pickle.loads(await request.body())
+            params = await _read_payload_params(request, self.allow_pickle)
 
-            params = params.map(AutoContainer.from_payload)
-            ret = await runner_method.async_run(*params.args, **params.kwargs)
-
-            payload = AutoContainer.to_payload(ret, 0)
+            payload = await _run_payloads(runner_method, params)
             return Response(
                 payload.data,
                 headers={
@@ -226,3 +340,59 @@ class RunnerAppFactory(BaseAppFactory):
             )
 
         return _run
+
+    def async_run_batch(
+        self,
+        runner_method: RunnerMethod[t.Any, t.Any, t.Any],
+    ) -> t.Callable[[Request], t.Coroutine[None, None, Response]]:
+        from starlette.responses import Response
+
+        async def _run(request: Request) -> Response:
+            assert self._is_ready
+
+            params_list = msgpack_to_payload_paramss(await request.body())
+
+            results: list[Payload | str] = []
+            if runner_method.config.batchable:
+                # Batches are capped at max_batch_size calls, like the ones formed by
+                # the CorkDispatcher. Calls of a batchable method share the fate of
+                # their batch, any exception results in an error for all of them.
+                max_batch_size = runner_method.max_batch_size
+                for start in range(0, len(params_list), max_batch_size):
+                    batch = params_list[start : start + max_batch_size]
+                    try:
+                        results.extend(await _run_batch_payloads(runner_method, batch))
+                    except Exception:  # pylint: disable=broad-except
+                        logger.error(
+                            "Exception on runner '%s' method '%s'",
+                            self.runner.name,
+                            runner_method.name,
+                            exc_info=True,
+                        )
+                        results.extend(["Internal Server Error"] * len(batch))
+            else:
+                rets = await asyncio.gather(
+                    *(_run_payloads(runner_method, p) for p in params_list),
+                    return_exceptions=True,
+                )
+                for ret in rets:
+                    if isinstance(ret, BaseException):
+                        logger.error(
+                            "Exception on runner '%s' method '%s'",
+                            self.runner.name,
+                            runner_method.name,
+                            exc_info=ret,
+                        )
+                        results.append("Internal Server Error")
+                    else:
+                        results.append(ret)
+
+            return Response(
+                payload_results_to_msgpack(results),
+                headers={
+                    "Content-Type": PAYLOAD_PARAMS_MSGPACK_CONTENT_TYPE,
+                    "Server": f"BentoML-Runner/{self.runner.name}/{runner_method.name}/{self.worker_index}",
+                },
+            )
+
+        return _run
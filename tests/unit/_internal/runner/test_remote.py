@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import typing as t
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bentoml.exceptions import RemoteException
+from bentoml._internal.runner.utils import Params
+from bentoml._internal.runner.container import Payload
+from bentoml._internal.runner.container import AutoContainer
+from bentoml._internal.runner.runner_handle.remote import _estimate_nbytes
+from bentoml._internal.runner.runner_handle.remote import _payload_container
+from bentoml._internal.runner.runner_handle.remote import RemoteRunnerClient
+
+
+@pytest.mark.parametrize(
+    "container",
+    [
+        "DefaultContainer",
+        "NdarrayContainer",
+        "PandasDataFrameContainer",
+    ],
+)
+def test_payload_container(container: str):
+    assert _payload_container(f"application/vnd.bentoml.{container}") == container
+    assert _payload_container(f"Application/Vnd.BentoML.{container}") == container
+
+
+def test_payload_container_strip_characters():
+    # str.strip() based parsing dropped leading/trailing characters of the prefix
+    assert _payload_container("application/vnd.bentoml.ArrowTable") == "ArrowTable"
+    assert _payload_container("application/vnd.bentoml.edge.") == "edge."
+
+
+def test_payload_container_invalid():
+    assert _payload_container("application/json") is None
+    assert _payload_container("text/html; charset=utf-8") is None
+
+
+def test_estimate_nbytes():
+    arr = np.zeros((100, 10))
+    assert _estimate_nbytes(arr) == arr.nbytes
+    assert _estimate_nbytes(pd.DataFrame(arr)) >= arr.nbytes
+    assert _estimate_nbytes(pd.Series(arr[:, 0])) == arr[:, 0].nbytes
+    assert _estimate_nbytes("a string") == 0
+
+
+def test_run_method_in_event_loop():
+    client = RemoteRunnerClient(SimpleNamespace(name="test_runner"))  # type: ignore
+
+    async def run():
+        # blocking on the result would deadlock the running loop
+        with pytest.raises(RuntimeError):
+            client.run_method(SimpleNamespace(name="__call__"))  # type: ignore
+
+    asyncio.run(run())
+
+
+def _remote_client(name: str = "test_runner") -> RemoteRunnerClient:
+    client = RemoteRunnerClient(SimpleNamespace(name=name))  # type: ignore
+    client._remote_runner_server_map_cache = {name: "tcp://127.0.0.1:3000"}
+    client._runner_config_cache = {
+        "timeout": 10,
+        "connection_limit": 10,
+        "per_host_limit": 0,
+    }
+    return client
+
+
+def test_session_per_loop():
+    client = _remote_client()
+
+    async def get_session():
+        assert client._client is client._client
+        return client._client
+
+    loop = asyncio.new_event_loop()
+    try:
+        first = loop.run_until_complete(get_session())
+        second = asyncio.run(get_session())
+        assert first is not second
+        # the session of the first loop is still the one used in that loop
+        assert loop.run_until_complete(get_session()) is first
+    finally:
+        loop.close()
+
+
+def test_close_sessions_in_their_loop():
+    client = _remote_client()
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+
+        async def get_session():
+            return client._client
+
+        session = asyncio.run_coroutine_threadsafe(get_session(), loop).result()
+        conn = session.connector
+        client._close_sessions()
+
+        async def closed():
+            while not (session.closed and conn.closed):
+                await asyncio.sleep(0.01)
+
+        asyncio.run_coroutine_threadsafe(closed(), loop).result(timeout=5)
+        assert not client._sessions
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def _batching_client(
+    post_batch: t.Callable[..., t.Awaitable[list[Payload | str]]],
+    max_batch_size: int = 10,
+    max_latency_ms: int = 50,
+) -> RemoteRunnerClient:
+    client = _remote_client()
+    assert client._runner_config_cache is not None
+    client._runner_config_cache["client_batching"] = {
+        "enabled": True,
+        "max_batch_size": max_batch_size,
+        "max_latency_ms": max_latency_ms,
+    }
+    client._post_batch = post_batch  # type: ignore
+    return client
+
+
+def _call(i: int) -> Params[Payload]:
+    return Params[Payload](Payload(str(i).encode(), {}, "DefaultContainer"))
+
+
+_METHOD = SimpleNamespace(name="predict")
+
+
+def test_client_batching_max_batch_size():
+    sent: list[list[bytes]] = []
+
+    async def post_batch(_: t.Any, paramss: list[Params[Payload]]):
+        sent.append([p.sample.data for p in paramss])
+        return [p.sample for p in paramss]
+
+    client = _batching_client(post_batch, max_batch_size=2)
+
+    async def run():
+        return await asyncio.gather(
+            *(client._batched_run(_METHOD, _call(i)) for i in range(5))  # type: ignore
+        )
+
+    results = asyncio.run(run())
+    assert [r.data for r in results] == [b"0", b"1", b"2", b"3", b"4"]
+    assert sent == [[b"0", b"1"], [b"2", b"3"], [b"4"]]
+
+
+def test_client_batching_max_latency():
+    sent: list[list[bytes]] = []
+
+    async def post_batch(_: t.Any, paramss: list[Params[Payload]]):
+        sent.append([p.sample.data for p in paramss])
+        return [p.sample for p in paramss]
+
+    client = _batching_client(post_batch, max_latency_ms=50)
+
+    async def run():
+        first = asyncio.ensure_future(client._batched_run(_METHOD, _call(0)))  # type: ignore
+        await asyncio.sleep(0)
+        # joins the pending batch, which is then sent without waiting for more calls
+        second = asyncio.ensure_future(client._batched_run(_METHOD, _call(1)))  # type: ignore
+        await asyncio.wait_for(asyncio.gather(first, second), timeout=5)
+        # once the batch is sent, calls go in a new one
+        await client._batched_run(_METHOD, _call(2))  # type: ignore
+
+    asyncio.run(run())
+    assert sent == [[b"0", b"1"], [b"2"]]
+
+
+def test_client_batching_errors():
+    async def post_batch(_: t.Any, paramss: list[Params[Payload]]):
+        return [paramss[0].sample, "Internal Server Error"]
+
+    client = _batching_client(post_batch)
+
+    async def run():
+        return await asyncio.gather(
+            *(client._batched_run(_METHOD, _call(i)) for i in range(2)),  # type: ignore
+            return_exceptions=True,
+        )
+
+    ok, error = asyncio.run(run())
+    assert ok.data == b"0"
+    assert isinstance(error, RemoteException)
+    assert "Internal Server Error" in str(error)
+
+
+def test_client_batching_failed_batch():
+    async def post_batch(_: t.Any, paramss: list[Params[Payload]]):
+        raise RemoteException("batch failed")
+
+    client = _batching_client(post_batch)
+
+    async def run():
+        return await asyncio.gather(
+            *(client._batched_run(_METHOD, _call(i)) for i in range(3)),  # type: ignore
+            return_exceptions=True,
+        )
+
+    errors = asyncio.run(run())
+    assert all(isinstance(e, RemoteException) for e in errors)
+    assert all(str(e) == "batch failed" for e in errors)
+
+
+def test_client_batching_cancelled_call():
+    async def run():
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def post_batch(_: t.Any, paramss: list[Params[Payload]]):
+            started.set()
+            await release.wait()
+            return [p.sample for p in paramss]
+
+        client = _batching_client(post_batch)
+        tasks = [
+            asyncio.ensure_future(client._batched_run(_METHOD, _call(i)))  # type: ignore
+            for i in range(3)
+        ]
+        await started.wait()
+        tasks[0].cancel()
+        release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    cancelled, *results = asyncio.run(run())
+    assert isinstance(cancelled, asyncio.CancelledError)
+    assert [r.data for r in results] == [b"1", b"2"]
+
+
+class _ChunkedContent:
+    def __init__(self, chunks: list[bytes]):
+        self._chunks = chunks
+
+    async def iter_chunked(self, _: int) -> t.AsyncIterator[bytes]:
+        for chunk in self._chunks:
+            yield chunk
+
+
+def test_read_body_preallocated():
+    arr = np.arange(100_000)
+    payload = AutoContainer.to_payload(arr, 0)
+    data = bytes(payload.data)
+    chunks = [data[i : i + 65536] for i in range(0, len(data), 65536)]
+    resp = SimpleNamespace(
+        status=200, content_length=len(data), content=_ChunkedContent(chunks)
+    )
+
+    body = asyncio.run(RemoteRunnerClient._read_body(resp))  # type: ignore
+    assert body == data
+    restored = AutoContainer.from_payload(payload._replace(data=body))
+    np.testing.assert_array_equal(restored, arr)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+
+from bentoml._internal.runner.utils import Params
+from bentoml._internal.runner.utils import header_to_payload_params
+from bentoml._internal.runner.utils import payload_params_to_header
+from bentoml._internal.runner.utils import payload_params_to_pickle
+from bentoml._internal.runner.utils import pickle_to_payload_params
+from bentoml._internal.runner.utils import msgpack_to_payload_paramss
+from bentoml._internal.runner.utils import msgpack_to_payload_results
+from bentoml._internal.runner.utils import payload_paramss_to_msgpack
+from bentoml._internal.runner.utils import payload_results_to_msgpack
+from bentoml._internal.runner.container import Payload
+
+
+def test_payload_params_header_roundtrip():
+    params = Params[Payload](
+        Payload(b"\x00\x01", {"plasma": False}, "NdarrayContainer", 2),
+        x=Payload(b"abc", {}, "DefaultContainer"),
+    )
+
+    header = payload_params_to_header(params)
+    assert b"abc" not in header
+
+    restored = header_to_payload_params(header, [b"\x00\x01", b"abc"])
+    assert restored.args == params.args
+    assert restored.kwargs == params.kwargs
+    assert isinstance(restored.args[0], Payload)
+
+    with pytest.raises(ValueError):
+        header_to_payload_params(header, [b"\x00\x01"])
+
+
+def test_payload_params_pickle_roundtrip():
+    params = Params[Payload](
+        Payload(b"\x00\x01", {"plasma": False}, "NdarrayContainer", 2),
+        x=Payload(b"abc", {}, "DefaultContainer"),
+    )
+
+    header, datas = payload_params_to_pickle(params)
+    restored = pickle_to_payload_params(header, [bytes(d) for d in datas])
+    assert restored.args == params.args
+    assert restored.kwargs == params.kwargs
+
+
+def test_payload_paramss_msgpack_roundtrip():
+    p1 = Payload(b"\x00\x01", {"plasma": False}, "NdarrayContainer", 2)
+    p2 = Payload(b"abc", {}, "DefaultContainer")
+    paramss = [Params[Payload](p1, x=p2), Params[Payload](p2)]
+
+    restored = msgpack_to_payload_paramss(payload_paramss_to_msgpack(paramss))
+    assert [(p.args, p.kwargs) for p in restored] == [
+        (p.args, p.kwargs) for p in paramss
+    ]
+
+    results = [p1, "Internal Server Error"]
+    assert msgpack_to_payload_results(payload_results_to_msgpack(results)) == results
+
+
+def test_params_all_batch_sizes_equal():
+    p1 = Payload(b"", {}, "NdarrayContainer", 2)
+    p2 = Payload(b"", {}, "NdarrayContainer", 3)
+
+    assert Params[Payload](p1, x=p1).all_batch_sizes_equal()
+    assert not Params[Payload](p1, x=p2).all_batch_sizes_equal()
+    assert Params[Payload]().all_batch_sizes_equal()
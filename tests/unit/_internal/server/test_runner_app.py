@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import typing as t
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import aiohttp
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.exceptions import HTTPException
+
+from bentoml._internal.runner.utils import Params
+from bentoml._internal.runner.utils import payload_params_to_header
+from bentoml._internal.runner.utils import payload_params_to_pickle
+from bentoml._internal.runner.utils import msgpack_to_payload_results
+from bentoml._internal.runner.utils import payload_paramss_to_msgpack
+from bentoml._internal.runner.utils import PAYLOAD_PARAMS_PICKLE_CONTENT_TYPE
+from bentoml._internal.runner.utils import PAYLOAD_PARAMS_MSGPACK_CONTENT_TYPE
+from bentoml._internal.runner.container import Payload
+from bentoml._internal.runner.container import AutoContainer
+from bentoml._internal.server.runner_app import RunnerAppFactory
+from bentoml._internal.server.runner_app import _read_payload_params
+from bentoml._internal.server.runner_app import _read_multipart_parts
+
+
+def _factory() -> RunnerAppFactory:
+    factory = RunnerAppFactory(SimpleNamespace(name="test_runner", runner_methods=[]))  # type: ignore
+    factory.mark_as_ready()
+    return factory
+
+
+def _request(body: bytes, content_type: str = "") -> Request:
+    async def receive() -> dict[str, t.Any]:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(b"content-type", content_type.encode())],
+    }
+    return Request(scope, receive)
+
+
+def _post(
+    factory: RunnerAppFactory,
+    endpoint: str,
+    runner_method: t.Any,
+    body: bytes,
+    content_type: str = "",
+) -> Response:
+    run = getattr(factory, endpoint)(runner_method=runner_method)
+    return asyncio.run(run(_request(body, content_type)))
+
+
+def _batchable_method(batch_sizes: list[int]) -> t.Any:
+    async def async_run(arr: np.ndarray[t.Any, t.Any]) -> np.ndarray[t.Any, t.Any]:
+        batch_sizes.append(len(arr))
+        if (arr == 3).any():
+            raise ValueError("bad input")
+        return arr * 2
+
+    return SimpleNamespace(
+        name="predict",
+        config=SimpleNamespace(batchable=True, batch_dim=(0, 0)),
+        max_batch_size=2,
+        async_run=async_run,
+    )
+
+
+def _call(i: int) -> Params[Payload]:
+    return Params[Payload](AutoContainer.to_payload(np.array([i]), 0))
+
+
+def test_batch_endpoint_max_batch_size():
+    batch_sizes: list[int] = []
+    body = payload_paramss_to_msgpack([_call(i) for i in (0, 1, 2, 4, 5)])
+    resp = _post(_factory(), "async_run_batch", _batchable_method(batch_sizes), body)
+    assert resp.status_code == 200
+    assert batch_sizes == [2, 2, 1]
+    results = msgpack_to_payload_results(resp.body)
+    assert [AutoContainer.from_payload(r).tolist() for r in results] == [
+        [0],
+        [2],
+        [4],
+        [8],
+        [10],
+    ]
+
+
+def test_batch_endpoint_failed_batch():
+    batch_sizes: list[int] = []
+    body = payload_paramss_to_msgpack([_call(i) for i in (1, 2, 3, 4)])
+    resp = _post(_factory(), "async_run_batch", _batchable_method(batch_sizes), body)
+    assert resp.status_code == 200
+    assert batch_sizes == [2, 2]
+    # only the calls batched with the failing one get an error
+    results = msgpack_to_payload_results(resp.body)
+    assert AutoContainer.from_payload(results[0]).tolist() == [2]
+    assert AutoContainer.from_payload(results[1]).tolist() == [4]
+    assert results[2:] == ["Internal Server Error", "Internal Server Error"]
+
+
+class _BodyWriter:
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    async def write(self, data: bytes) -> None:
+        self.chunks.append(bytes(data))
+
+
+def _multipart_body(
+    header: bytes, header_type: str, datas: list[t.Any]
+) -> tuple[bytes, str]:
+    """
+    A request body built like the ones of RemoteRunnerClient, with its Content-Type.
+    """
+    writer = aiohttp.MultipartWriter("mixed")
+    writer.append(header, {"Content-Type": header_type})
+    for d in datas:
+        writer.append(d, {"Content-Type": "application/octet-stream"})
+    body = _BodyWriter()
+    asyncio.run(writer.write(body))
+    return b"".join(body.chunks), writer.headers["Content-Type"]
+
+
+def _recording_method(calls: list[Params[t.Any]]) -> t.Any:
+    async def async_run(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        calls.append(Params[t.Any](*args, **kwargs))
+        return "ok"
+
+    return SimpleNamespace(
+        name="__call__",
+        config=SimpleNamespace(batchable=False, batch_dim=(0, 0)),
+        async_run=async_run,
+    )
+
+
+def _pickle_call() -> tuple[bytes, str]:
+    params = Params[Payload](AutoContainer.to_payload(np.arange(3), 0))
+    header, datas = payload_params_to_pickle(params)
+    return _multipart_body(header, PAYLOAD_PARAMS_PICKLE_CONTENT_TYPE, datas)
+
+
+def test_pickle_params_rejected_by_default():
+    factory = _factory()
+    assert not factory.allow_pickle
+    body, content_type = _pickle_call()
+    with pytest.raises(HTTPException) as excinfo:
+        _post(factory, "async_run", _recording_method([]), body, content_type)
+    assert excinfo.value.status_code == 400
+
+
+def test_pickle_params_allowed():
+    factory = _factory()
+    factory.allow_pickle = True
+    body, content_type = _pickle_call()
+    calls: list[Params[t.Any]] = []
+    resp = _post(factory, "async_run", _recording_method(calls), body, content_type)
+    assert resp.status_code == 200
+    assert calls[0].sample.tolist() == [0, 1, 2]
+
+
+@pytest.mark.parametrize("n_parts", [0, 1, 3])
+def test_read_multipart_parts(n_parts: int):
+    datas = [bytes([i]) * (i * 1000) for i in range(n_parts)]
+    body, content_type = _multipart_body(
+        b"header", PAYLOAD_PARAMS_MSGPACK_CONTENT_TYPE, datas
+    )
+
+    parts = asyncio.run(_read_multipart_parts(_request(body, content_type)))
+    assert parts == [(PAYLOAD_PARAMS_MSGPACK_CONTENT_TYPE.encode(), b"header")] + [
+        (b"application/octet-stream", d) for d in datas
+    ]
+
+
+@pytest.mark.parametrize("serialization", ["msgpack", "pickle"])
+def test_read_payload_params_roundtrip(serialization: str):
+    params = Params[Payload](
+        Payload(b"\x00\x01", {"plasma": False}, "NdarrayContainer", 2),
+        z=Payload(b"last", {}, "DefaultContainer"),
+        a=Payload(b"", {}, "DefaultContainer"),
+    )
+    if serialization == "pickle":
+        header, datas = payload_params_to_pickle(params)
+        header_type = PAYLOAD_PARAMS_PICKLE_CONTENT_TYPE
+    else:
+        header = payload_params_to_header(params)
+        datas = [payload.data for _, payload in params.items()]
+        header_type = PAYLOAD_PARAMS_MSGPACK_CONTENT_TYPE
+    body, content_type = _multipart_body(header, header_type, datas)
+
+    restored = asyncio.run(
+        _read_payload_params(_request(body, content_type), allow_pickle=True)
+    )
+    assert [bytes(p.data) for p in restored.args] == [b"\x00\x01"]
+    assert restored.args[0].batch_size == 2
+    assert list(restored.kwargs) == ["z", "a"]
+    assert [bytes(p.data) for p in restored.kwargs.values()] == [b"last", b""]
+
+
+def test_read_payload_params_missing_parts():
+    params = Params[Payload](
+        Payload(b"abc", {}, "DefaultContainer"),
+        Payload(b"def", {}, "DefaultContainer"),
+    )
+    body, content_type = _multipart_body(
+        payload_params_to_header(params), PAYLOAD_PARAMS_MSGPACK_CONTENT_TYPE, [b"abc"]
+    )
+    with pytest.raises(HTTPException) as excinfo:
+        _post(_factory(), "async_run", _recording_method([]), body, content_type)
+    assert excinfo.value.status_code == 400
+
+
+def test_read_payload_params_not_multipart():
+    with pytest.raises(HTTPException) as excinfo:
+        _post(_factory(), "async_run", _recording_method([]), b"{}", "application/json")
+    assert excinfo.value.status_code == 400
@@ -108,3 +108,29 @@ def test_runner_timeouts():
     assert runner_cfg["timeout"] == 50
     assert runner_cfg["test_runner_1"]["timeout"] == 100
     assert runner_cfg["test_runner_2"]["timeout"] == 50
+
+
+RUNNER_CLIENT_OPTIONS = """\
+runners:
+    serialization: pickle
+    connection_limit: 100
+    test_runner_1:
+        per_host_limit: 10
+        client_batching:
+            enabled: True
+"""
+
+
+def test_runner_client_options():
+    bentoml_cfg = get_bentomlconfiguration_from_str(RUNNER_CLIENT_OPTIONS)
+    runner_cfg = bentoml_cfg["runners"]
+    assert runner_cfg["serialization"] == "pickle"
+    assert runner_cfg["client_batching"]["enabled"] is False
+    assert runner_cfg["per_host_limit"] == 0
+
+    test_runner_1 = runner_cfg["test_runner_1"]
+    assert test_runner_1["serialization"] == "pickle"
+    assert test_runner_1["connection_limit"] == 100
+    assert test_runner_1["per_host_limit"] == 10
+    assert test_runner_1["client_batching"]["enabled"] is True
+    assert test_runner_1["client_batching"]["max_latency_ms"] == 1